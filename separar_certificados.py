@@ -1,532 +1,1071 @@
-"""
-Sistema para Separar Certificados PDF
-=====================================
-Este script toma un PDF con múltiples certificados (uno por página)
-y los separa en PDFs individuales, renombrándolos según el nombre
-que aparece en cada certificado o según una lista proporcionada.
-
-Estructura de carpetas:
-    entrada/  -> Colocar aquí los PDFs a procesar
-    salida/   -> Aquí se guardarán los certificados separados
-
-Uso:
-    1. Simple (procesa todos los PDFs en 'entrada/'):
-       python separar_certificados.py
-    
-    2. Archivo específico:
-       python separar_certificados.py --archivo entrada/certificados.pdf
-    
-    3. Con lista de nombres (Excel/CSV):
-       python separar_certificados.py --lista nombres.xlsx
-    
-    4. Ver patrones de búsqueda disponibles:
-       python separar_certificados.py --ver-patrones
-"""
-
-import fitz  # PyMuPDF
-import os
-import sys
-import re
-import argparse
-from pathlib import Path
-
-
-# Configuración de carpetas
-CARPETA_ENTRADA = "entrada"
-CARPETA_SALIDA = "salida"
-ARCHIVO_PATRONES = "patrones.txt"
-
-
-def limpiar_carpeta_salida():
-    """
-    Elimina todos los archivos PDF de la carpeta de salida antes de procesar.
-    """
-    carpeta_salida = Path(__file__).parent / CARPETA_SALIDA
-    
-    if not carpeta_salida.exists():
-        return 0
-    
-    archivos_pdf = list(carpeta_salida.glob("*.pdf"))
-    eliminados = 0
-    
-    for archivo in archivos_pdf:
-        try:
-            archivo.unlink()
-            eliminados += 1
-        except Exception as e:
-            print(f"⚠️  No se pudo eliminar {archivo.name}: {e}")
-    
-    if eliminados > 0:
-        print(f"🗑️  Se eliminaron {eliminados} archivo(s) de la carpeta 'salida/'")
-    
-    return eliminados
-
-
-def eliminar_pdf_entrada(ruta_pdf: str):
-    """
-    Elimina un PDF de la carpeta de entrada después de procesarlo.
-    """
-    try:
-        archivo = Path(ruta_pdf)
-        if archivo.exists():
-            archivo.unlink()
-            print(f"🗑️  Eliminado de entrada: {archivo.name}")
-            return True
-    except Exception as e:
-        print(f"⚠️  No se pudo eliminar {ruta_pdf}: {e}")
-    return False
-
-
-def limpiar_nombre_archivo(nombre: str) -> str:
-    """
-    Limpia el nombre para que sea válido como nombre de archivo.
-    Elimina caracteres especiales y espacios extra.
-    """
-    # Eliminar caracteres no válidos para nombres de archivo
-    nombre_limpio = re.sub(r'[<>:"/\\|?*]', '', nombre)
-    # Reemplazar múltiples espacios por uno solo
-    nombre_limpio = re.sub(r'\s+', ' ', nombre_limpio)
-    # Eliminar espacios al inicio y final
-    nombre_limpio = nombre_limpio.strip()
-    # Limitar longitud del nombre
-    if len(nombre_limpio) > 100:
-        nombre_limpio = nombre_limpio[:100]
-    # Si el nombre está vacío, usar un nombre por defecto
-    if not nombre_limpio:
-        nombre_limpio = "certificado_sin_nombre"
-    return nombre_limpio
-
-
-def cargar_patrones(ruta_archivo: str = None) -> list:
-    """
-    Carga los patrones de búsqueda desde el archivo patrones.txt
-    
-    Returns:
-        Lista de patrones regex
-    """
-    if ruta_archivo is None:
-        ruta_archivo = Path(__file__).parent / ARCHIVO_PATRONES
-    
-    patrones = []
-    
-    if not os.path.exists(ruta_archivo):
-        print(f"⚠️  Archivo de patrones no encontrado: {ruta_archivo}")
-        print("   Usando patrones por defecto...")
-        return [
-            r"Se otorga el presente reconocimiento a:\s*\n?\s*(.+?)(?:\n|Por su)",
-            r"[Oo]torga(?:do)? a:\s*(.+?)(?:\n|$)",
-            r"[Cc]ertifica(?:do)? a:\s*(.+?)(?:\n|$)",
-        ]
-    
-    try:
-        with open(ruta_archivo, 'r', encoding='utf-8') as f:
-            for linea in f:
-                linea = linea.strip()
-                # Ignorar líneas vacías y comentarios
-                if linea and not linea.startswith('#'):
-                    patrones.append(linea)
-    except Exception as e:
-        print(f"⚠️  Error al leer patrones: {e}")
-    
-    return patrones
-
-
-def extraer_nombre_de_pagina(pagina, patrones: list = None) -> str:
-    """
-    Extrae el nombre del destinatario del certificado de una página.
-    
-    Args:
-        pagina: Objeto de página de PyMuPDF
-        patrones: Lista de patrones regex para buscar el nombre
-    
-    Returns:
-        Nombre extraído o None si no se encuentra
-    """
-    texto = pagina.get_text()
-    
-    if patrones is None:
-        patrones = cargar_patrones()
-    
-    for patron_regex in patrones:
-        try:
-            match = re.search(patron_regex, texto, re.IGNORECASE | re.DOTALL)
-            if match:
-                nombre = match.group(1).strip()
-                # Limpiar el nombre de saltos de línea y espacios extra
-                nombre = re.sub(r'\s+', ' ', nombre)
-                # Eliminar texto innecesario que pueda haberse capturado
-                nombre = nombre.split('\n')[0].strip()
-                if nombre and len(nombre) > 2:
-                    return nombre
-        except re.error as e:
-            print(f"⚠️  Patrón inválido ignorado: {patron_regex} ({e})")
-    
-    return None
-
-
-def cargar_lista_nombres(ruta_archivo: str) -> list:
-    """
-    Carga una lista de nombres desde un archivo Excel o CSV.
-    
-    Args:
-        ruta_archivo: Ruta al archivo Excel (.xlsx, .xls) o CSV
-    
-    Returns:
-        Lista de nombres
-    """
-    import pandas as pd
-    
-    extension = Path(ruta_archivo).suffix.lower()
-    
-    try:
-        if extension in ['.xlsx', '.xls']:
-            df = pd.read_excel(ruta_archivo, header=None)
-        elif extension == '.csv':
-            df = pd.read_csv(ruta_archivo, header=None)
-        else:
-            raise ValueError(f"Formato de archivo no soportado: {extension}")
-        
-        # Tomar la primera columna como lista de nombres
-        nombres = df.iloc[:, 0].astype(str).tolist()
-        # Filtrar valores vacíos o NaN
-        nombres = [n for n in nombres if n and n.lower() != 'nan' and n.strip()]
-        
-        return nombres
-    
-    except Exception as e:
-        print(f"Error al cargar el archivo de lista: {e}")
-        return []
-
-
-def separar_certificados(
-    ruta_pdf: str,
-    carpeta_salida: str = None,
-    lista_nombres: list = None,
-    patrones: list = None,
-    prefijo: str = "",
-    sufijo: str = ""
-) -> dict:
-    """
-    Separa un PDF de múltiples certificados en archivos individuales.
-    """
-    # Validar que el archivo existe
-    if not os.path.exists(ruta_pdf):
-        raise FileNotFoundError(f"No se encontró el archivo: {ruta_pdf}")
-    
-    # Usar carpeta de salida por defecto
-    if carpeta_salida is None:
-        carpeta_salida = Path(__file__).parent / CARPETA_SALIDA
-    
-    carpeta_salida = Path(carpeta_salida)
-    carpeta_salida.mkdir(parents=True, exist_ok=True)
-    
-    # Cargar patrones si no se proporcionan
-    if patrones is None:
-        patrones = cargar_patrones()
-    
-    # Abrir el PDF
-    documento = fitz.open(ruta_pdf)
-    total_paginas = len(documento)
-    
-    nombre_pdf = Path(ruta_pdf).name
-    
-    print(f"\n{'='*60}")
-    print(f"📄 Archivo: {nombre_pdf}")
-    print(f"📑 Total de páginas/certificados: {total_paginas}")
-    print(f"📁 Carpeta de salida: {carpeta_salida}")
-    print(f"🔍 Patrones cargados: {len(patrones)}")
-    print(f"{'='*60}\n")
-    
-    # Validar lista de nombres si se proporciona
-    if lista_nombres:
-        if len(lista_nombres) < total_paginas:
-            print(f"⚠️  Advertencia: La lista tiene {len(lista_nombres)} nombres pero hay {total_paginas} páginas.")
-            print("    Se usará extracción automática para las páginas restantes.\n")
-    
-    resultados = {
-        "exitosos": [],
-        "errores": [],
-        "total": total_paginas,
-        "pdf_origen": nombre_pdf
-    }
-    
-    # Procesar cada página
-    for i in range(total_paginas):
-        pagina = documento[i]
-        numero = i + 1
-        
-        # Determinar el nombre del archivo
-        if lista_nombres and i < len(lista_nombres):
-            nombre = lista_nombres[i]
-            origen = "lista"
-        else:
-            nombre = extraer_nombre_de_pagina(pagina, patrones)
-            origen = "extraído"
-        
-        # Si no se pudo obtener un nombre, usar número de página
-        if not nombre:
-            nombre = f"certificado_{numero:03d}"
-            origen = "generado"
-        
-        # Limpiar nombre para uso como archivo
-        nombre_limpio = limpiar_nombre_archivo(nombre)
-        nombre_archivo = f"{prefijo}{nombre_limpio}{sufijo}.pdf"
-        ruta_salida = carpeta_salida / nombre_archivo
-        
-        # Manejar nombres duplicados
-        contador = 1
-        while ruta_salida.exists():
-            nombre_archivo = f"{prefijo}{nombre_limpio}_{contador}{sufijo}.pdf"
-            ruta_salida = carpeta_salida / nombre_archivo
-            contador += 1
-        
-        try:
-            # Crear nuevo PDF con esta página
-            nuevo_pdf = fitz.open()
-            nuevo_pdf.insert_pdf(documento, from_page=i, to_page=i)
-            nuevo_pdf.save(str(ruta_salida))
-            nuevo_pdf.close()
-            
-            estado = "✅" if origen != "generado" else "⚠️"
-            print(f"{estado} [{numero}/{total_paginas}] {nombre_archivo}")
-            print(f"   └─ Nombre: {nombre} ({origen})")
-            
-            resultados["exitosos"].append({
-                "pagina": numero,
-                "nombre": nombre,
-                "archivo": str(ruta_salida),
-                "origen": origen
-            })
-            
-        except Exception as e:
-            print(f"❌ [{numero}/{total_paginas}] Error al procesar página: {e}")
-            resultados["errores"].append({
-                "pagina": numero,
-                "error": str(e)
-            })
-    
-    documento.close()
-    
-    # Contar por origen
-    extraidos = len([r for r in resultados["exitosos"] if r["origen"] == "extraído"])
-    de_lista = len([r for r in resultados["exitosos"] if r["origen"] == "lista"])
-    generados = len([r for r in resultados["exitosos"] if r["origen"] == "generado"])
-    
-    # Resumen final
-    print(f"\n{'='*60}")
-    print(f"📊 RESUMEN - {nombre_pdf}")
-    print(f"{'='*60}")
-    print(f"✅ Exitosos: {len(resultados['exitosos'])}/{total_paginas}")
-    if extraidos > 0:
-        print(f"   └─ Nombres extraídos del PDF: {extraidos}")
-    if de_lista > 0:
-        print(f"   └─ Nombres de lista: {de_lista}")
-    if generados > 0:
-        print(f"   └─ Nombres generados (no encontrados): {generados}")
-    print(f"❌ Errores: {len(resultados['errores'])}/{total_paginas}")
-    print(f"📁 Archivos guardados en: {carpeta_salida}")
-    print(f"{'='*60}\n")
-    
-    return resultados
-
-
-def procesar_carpeta_entrada(
-    lista_nombres: list = None,
-    prefijo: str = "",
-    sufijo: str = "",
-    limpiar_salida: bool = True,
-    eliminar_entrada: bool = True
-) -> list:
-    """
-    Procesa todos los PDFs en la carpeta de entrada.
-    
-    Args:
-        lista_nombres: Lista opcional de nombres para renombrar
-        prefijo: Prefijo para agregar al nombre de cada archivo
-        sufijo: Sufijo para agregar al nombre de cada archivo
-        limpiar_salida: Si True, elimina los PDFs existentes en salida antes de procesar
-        eliminar_entrada: Si True, elimina los PDFs de entrada después de procesarlos
-    """
-    carpeta_entrada = Path(__file__).parent / CARPETA_ENTRADA
-    carpeta_salida = Path(__file__).parent / CARPETA_SALIDA
-    
-    if not carpeta_entrada.exists():
-        carpeta_entrada.mkdir(parents=True, exist_ok=True)
-        print(f"📁 Se creó la carpeta 'entrada/'. Coloca tus PDFs ahí y ejecuta de nuevo.")
-        return []
-    
-    archivos_pdf = list(carpeta_entrada.glob("*.pdf"))
-    
-    if not archivos_pdf:
-        print(f"⚠️  No se encontraron archivos PDF en: {carpeta_entrada}")
-        print("   Coloca tus PDFs en la carpeta 'entrada/' y ejecuta de nuevo.")
-        return []
-    
-    print(f"\n🔍 Encontrados {len(archivos_pdf)} archivo(s) PDF en 'entrada/'")
-    
-    # Limpiar carpeta de salida antes de procesar
-    if limpiar_salida:
-        limpiar_carpeta_salida()
-    
-    todos_resultados = []
-    patrones = cargar_patrones()
-    pdfs_procesados = []  # Lista de PDFs procesados exitosamente
-    
-    for pdf in archivos_pdf:
-        try:
-            resultado = separar_certificados(
-                ruta_pdf=str(pdf),
-                carpeta_salida=str(carpeta_salida),
-                lista_nombres=lista_nombres,
-                patrones=patrones,
-                prefijo=prefijo,
-                sufijo=sufijo
-            )
-            todos_resultados.append(resultado)
-            
-            # Si no hubo errores, marcar para eliminar
-            if not resultado["errores"]:
-                pdfs_procesados.append(str(pdf))
-                
-        except Exception as e:
-            print(f"❌ Error procesando {pdf.name}: {e}")
-    
-    # Eliminar PDFs de entrada después de procesar exitosamente
-    if eliminar_entrada and pdfs_procesados:
-        print(f"\n🗑️  Limpiando carpeta de entrada...")
-        for pdf_path in pdfs_procesados:
-            eliminar_pdf_entrada(pdf_path)
-    
-    return todos_resultados
-
-
-def mostrar_patrones():
-    """Muestra los patrones de búsqueda actuales."""
-    patrones = cargar_patrones()
-    
-    print(f"\n{'='*60}")
-    print("🔍 PATRONES DE BÚSQUEDA CONFIGURADOS")
-    print(f"{'='*60}")
-    print(f"📄 Archivo: {ARCHIVO_PATRONES}\n")
-    
-    for i, patron in enumerate(patrones, 1):
-        print(f"  {i}. {patron}")
-    
-    print(f"\n{'='*60}")
-    print("💡 Para agregar nuevos patrones, edita el archivo 'patrones.txt'")
-    print(f"{'='*60}\n")
-
-
-def main():
-    """Función principal del script."""
-    parser = argparse.ArgumentParser(
-        description="Separar PDFs de certificados en archivos individuales",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Ejemplos de uso:
-  python separar_certificados.py                           # Procesa todos los PDFs en 'entrada/'
-  python separar_certificados.py --archivo mi_archivo.pdf  # Procesa un archivo específico
-  python separar_certificados.py --lista nombres.xlsx      # Usa nombres de un Excel
-  python separar_certificados.py --ver-patrones            # Muestra los patrones configurados
-        """
-    )
-    
-    parser.add_argument(
-        "--archivo", "-a",
-        help="Ruta a un archivo PDF específico (si no se especifica, procesa la carpeta 'entrada/')",
-        default=None
-    )
-    
-    parser.add_argument(
-        "--lista", "-l",
-        help="Archivo Excel o CSV con lista de nombres (en orden)",
-        default=None
-    )
-    
-    parser.add_argument(
-        "--salida", "-o",
-        help="Carpeta donde guardar los certificados separados (por defecto: 'salida/')",
-        default=None
-    )
-    
-    parser.add_argument(
-        "--prefijo",
-        help="Prefijo para agregar al nombre de cada archivo",
-        default=""
-    )
-    
-    parser.add_argument(
-        "--sufijo",
-        help="Sufijo para agregar al nombre de cada archivo (antes de .pdf)",
-        default=""
-    )
-    
-    parser.add_argument(
-        "--ver-patrones",
-        action="store_true",
-        help="Muestra los patrones de búsqueda configurados"
-    )
-    
-    parser.add_argument(
-        "--no-limpiar",
-        action="store_true",
-        help="No eliminar archivos de salida antes de procesar"
-    )
-    
-    parser.add_argument(
-        "--no-borrar-entrada",
-        action="store_true",
-        help="No eliminar PDFs de entrada después de procesarlos"
-    )
-    
-    args = parser.parse_args()
-    
-    # Mostrar patrones si se solicita
-    if args.ver_patrones:
-        mostrar_patrones()
-        return
-    
-    # Cargar lista de nombres si se proporciona
-    lista_nombres = None
-    if args.lista:
-        if not os.path.exists(args.lista):
-            print(f"❌ Error: No se encontró el archivo de lista: {args.lista}")
-            sys.exit(1)
-        lista_nombres = cargar_lista_nombres(args.lista)
-        if lista_nombres:
-            print(f"📋 Lista cargada con {len(lista_nombres)} nombres")
-        else:
-            print("⚠️  No se pudieron cargar nombres de la lista. Se usará extracción automática.")
-    
-    # Procesar archivo específico o carpeta
-    try:
-        if args.archivo:
-            resultado = separar_certificados(
-                ruta_pdf=args.archivo,
-                carpeta_salida=args.salida,
-                lista_nombres=lista_nombres,
-                prefijo=args.prefijo,
-                sufijo=args.sufijo
-            )
-            if resultado["errores"]:
-                sys.exit(1)
-        else:
-            resultados = procesar_carpeta_entrada(
-                lista_nombres=lista_nombres,
-                prefijo=args.prefijo,
-                sufijo=args.sufijo,
-                limpiar_salida=not args.no_limpiar,
-                eliminar_entrada=not args.no_borrar_entrada
-            )
-            if not resultados:
-                sys.exit(1)
-        
-        sys.exit(0)
-        
-    except Exception as e:
-        print(f"❌ Error fatal: {e}")
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
+"""
+Sistema para Separar Certificados PDF
+=====================================
+Este script toma un PDF con múltiples certificados (uno por página)
+y los separa en PDFs individuales, renombrándolos según el nombre
+que aparece en cada certificado o según una lista proporcionada.
+
+Estructura de carpetas:
+    entrada/  -> Colocar aquí los PDFs a procesar
+    salida/   -> Aquí se guardarán los certificados separados
+
+Uso:
+    1. Simple (procesa todos los PDFs en 'entrada/'):
+       python separar_certificados.py
+    
+    2. Archivo específico:
+       python separar_certificados.py --archivo entrada/certificados.pdf
+    
+    3. Con lista de nombres (Excel/CSV):
+       python separar_certificados.py --lista nombres.xlsx
+    
+    4. Ver patrones de búsqueda disponibles:
+       python separar_certificados.py --ver-patrones
+"""
+
+import fitz  # PyMuPDF
+import os
+import sys
+import re
+import argparse
+import collections
+import concurrent.futures
+import functools
+import io
+import mmap
+import queue
+import threading
+from pathlib import Path
+
+
+# Configuración de carpetas
+CARPETA_ENTRADA = "entrada"
+CARPETA_SALIDA = "salida"
+ARCHIVO_PATRONES = "patrones.txt"
+
+# Rutas resueltas una sola vez al cargar el módulo
+_BASE = Path(__file__).resolve().parent
+_ENTRADA = _BASE / CARPETA_ENTRADA
+_SALIDA = _BASE / CARPETA_SALIDA
+_PATRONES_PATH = _BASE / ARCHIVO_PATRONES
+
+# Tabla de traducción para eliminar caracteres no válidos en nombres de
+# archivo (str.translate es un bucle puro en C, sin motor de regex)
+_TRANS_STRIP = str.maketrans('', '', '<>:"/\\|?*')
+
+# Expresión regular precompilada (se compila una sola vez al cargar el módulo)
+_RE_WS = re.compile(r'\s+')
+
+# Opciones de guardado rápido para los PDFs de una sola página: se omiten
+# la recolección de basura, la limpieza de sintaxis y la regeneración del
+# ID del documento, pasadas costosas que no aportan nada a un PDF recién
+# creado a partir de una sola página
+_OPCIONES_GUARDADO = dict(garbage=0, deflate=False, clean=False, no_new_id=True)
+
+# Tamaño de buffer de escritura (2 MiB): en sistemas de archivos de red
+# (EFS, carpetas compartidas SMB) los buffers pequeños desaprovechan el
+# ancho de banda; en disco local el costo extra es despreciable
+TAMANO_BUFFER_ESCRITURA = 2 * 1024 * 1024
+
+# Banderas mínimas para extraer texto plano: conservar espacios y el
+# recorte al mediabox, sin preservar ligaduras ni procesar imágenes
+_FLAGS_TEXTO = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+# Fracción superior de la página donde normalmente aparece el nombre del
+# destinatario; solo se extrae esa región y, si ningún patrón coincide,
+# se reintenta con la página completa
+NOMBRE_CLIP_RATIO = 0.5
+
+# Cuántos mensajes de progreso acumular antes de vaciarlos a stdout de
+# una sola vez (cada página emite dos líneas); imprimir página por página
+# cuesta una adquisición del lock de stdout y un syscall por línea
+_LOTE_MENSAJES = 100
+
+# Profundidad de la cola del hilo escritor: basta con unas pocas páginas
+# en vuelo para solapar la escritura de la página i con la extracción de
+# la i+1; una cola corta acota la memoria en PDFs con páginas pesadas
+_PROFUNDIDAD_COLA_ESCRITURA = 4
+
+
+def _abrir_pdf(ruta_pdf: str):
+    """
+    Abre un PDF mapeándolo a memoria en lugar de leerlo a un buffer propio.
+
+    Con mmap el sistema operativo sirve las páginas bajo demanda desde el
+    page cache, así que el consumo de memoria no crece con el tamaño del
+    archivo. Si el mapeo no es posible se abre de la forma habitual.
+    """
+    try:
+        with open(ruta_pdf, 'rb') as f:
+            mapeo = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return fitz.open(ruta_pdf)
+
+    vista = memoryview(mapeo)
+    try:
+        documento = fitz.open(stream=vista, filetype='pdf')
+    except TypeError:
+        # PyMuPDF < 1.25 no acepta memoryview como stream
+        vista.release()
+        mapeo.close()
+        return fitz.open(ruta_pdf)
+
+    # Mantener vivo el mapeo mientras exista el documento
+    documento._mapeo = mapeo
+    return documento
+
+
+def _escribir_pdf(ruta: str, data: bytes, tamano_buffer: int = TAMANO_BUFFER_ESCRITURA):
+    """Escribe los bytes de un PDF a disco con un buffer de tamaño explícito."""
+    with open(ruta, 'wb', buffering=0) as raw:
+        with io.BufferedWriter(raw, buffer_size=tamano_buffer) as buf:
+            buf.write(data)
+
+
+def limpiar_carpeta_salida():
+    """
+    Elimina todos los archivos PDF de la carpeta de salida antes de procesar.
+    """
+    if not _SALIDA.exists():
+        return 0
+
+    eliminados = 0
+
+    # os.scandir evita el autómata de fnmatch de glob() y reutiliza la
+    # información de tipo que ya trae el recorrido del directorio
+    with os.scandir(_SALIDA) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                try:
+                    os.unlink(entry.path)
+                    eliminados += 1
+                except OSError as e:
+                    print(f"⚠️  No se pudo eliminar {entry.name}: {e}")
+
+    if eliminados > 0:
+        print(f"🗑️  Se eliminaron {eliminados} archivo(s) de la carpeta 'salida/'")
+    
+    return eliminados
+
+
+def eliminar_pdf_entrada(ruta_pdf: str):
+    """
+    Elimina un PDF de la carpeta de entrada después de procesarlo.
+    """
+    try:
+        archivo = Path(ruta_pdf)
+        if archivo.exists():
+            archivo.unlink()
+            print(f"🗑️  Eliminado de entrada: {archivo.name}")
+            return True
+    except Exception as e:
+        print(f"⚠️  No se pudo eliminar {ruta_pdf}: {e}")
+    return False
+
+
+def limpiar_nombre_archivo(nombre: str) -> str:
+    """
+    Limpia el nombre para que sea válido como nombre de archivo.
+    Elimina caracteres especiales y espacios extra.
+    """
+    # Eliminar caracteres no válidos para nombres de archivo
+    nombre_limpio = nombre.translate(_TRANS_STRIP)
+    # Reemplazar múltiples espacios por uno solo
+    nombre_limpio = _RE_WS.sub(' ', nombre_limpio)
+    # Eliminar espacios al inicio y final
+    nombre_limpio = nombre_limpio.strip()
+    # Limitar longitud del nombre
+    if len(nombre_limpio) > 100:
+        nombre_limpio = nombre_limpio[:100]
+    # Si el nombre está vacío, usar un nombre por defecto
+    if not nombre_limpio:
+        nombre_limpio = "certificado_sin_nombre"
+    return nombre_limpio
+
+
+def _cargar_patrones_archivo(ruta_archivo: str) -> list:
+    """Lee y compila los patrones de un archivo (sin caché)."""
+    patrones = []
+
+    if not os.path.exists(ruta_archivo):
+        print(f"⚠️  Archivo de patrones no encontrado: {ruta_archivo}")
+        print("   Usando patrones por defecto...")
+        return [
+            re.compile(patron, re.IGNORECASE | re.DOTALL)
+            for patron in (
+                r"Se otorga el presente reconocimiento a:\s*\n?\s*(.+?)(?:\n|Por su)",
+                r"[Oo]torga(?:do)? a:\s*(.+?)(?:\n|$)",
+                r"[Cc]ertifica(?:do)? a:\s*(.+?)(?:\n|$)",
+            )
+        ]
+
+    try:
+        with open(ruta_archivo, 'r', encoding='utf-8') as f:
+            for linea in f:
+                linea = linea.strip()
+                # Ignorar líneas vacías y comentarios
+                if linea and not linea.startswith('#'):
+                    try:
+                        patrones.append(re.compile(linea, re.IGNORECASE | re.DOTALL))
+                    except re.error as e:
+                        print(f"⚠️  Patrón inválido ignorado: {linea} ({e})")
+    except Exception as e:
+        print(f"⚠️  Error al leer patrones: {e}")
+
+    return patrones
+
+
+@functools.lru_cache(maxsize=8)
+def _cargar_patrones_cached(ruta_archivo: str, mtime: float) -> list:
+    # mtime solo forma parte de la clave: invalida la entrada si el
+    # archivo de patrones cambió entre llamadas
+    return _cargar_patrones_archivo(ruta_archivo)
+
+
+def cargar_patrones(ruta_archivo: str = None) -> list:
+    """
+    Carga los patrones de búsqueda desde el archivo patrones.txt
+
+    Los patrones se compilan una sola vez al cargarlos, para no pagar
+    el costo de compilación en cada página, y el resultado se cachea por
+    (ruta, mtime) para que llamadas repetidas no relean el archivo.
+
+    Returns:
+        Lista de patrones regex compilados (re.Pattern)
+    """
+    if ruta_archivo is None:
+        ruta_archivo = _PATRONES_PATH
+
+    ruta = str(ruta_archivo)
+    try:
+        mtime = os.path.getmtime(ruta)
+    except OSError:
+        mtime = 0
+
+    return _cargar_patrones_cached(ruta, mtime)
+
+
+def compilar_patron_unificado(patrones: list):
+    """
+    Combina todos los patrones en una sola alternación con grupos nombrados.
+
+    Esto permite buscar todos los patrones con un solo recorrido del texto
+    en lugar de un recorrido por patrón. Ojo con la prioridad: gana la
+    coincidencia más temprana en el texto (a igual posición, el patrón
+    listado primero), no el primer patrón del archivo que coincida en
+    cualquier parte de la página.
+
+    Args:
+        patrones: Lista de patrones regex compilados
+
+    Returns:
+        Tupla (patrón unificado, índices de grupo de captura por alternativa),
+        o None si los patrones no se pueden combinar (p. ej. grupos nombrados
+        en conflicto).
+    """
+    partes = []
+    indices = {}
+    siguiente_grupo = 1
+
+    for i, patron in enumerate(patrones):
+        partes.append(f"(?P<p{i}>{patron.pattern})")
+        # El grupo nombrado envuelve a cada patrón, así que su group(1)
+        # original queda desplazado una posición dentro del unificado
+        indices[f"p{i}"] = siguiente_grupo + 1
+        siguiente_grupo += 1 + patron.groups
+
+    try:
+        unificado = re.compile("|".join(partes), re.IGNORECASE | re.DOTALL)
+    except re.error:
+        return None
+
+    return unificado, indices
+
+
+_UNIFICADO_CACHE = {}
+
+
+def _patron_unificado(patrones: list):
+    """Devuelve (y cachea) el patrón unificado para una lista de patrones."""
+    clave = tuple(p.pattern for p in patrones)
+    if clave not in _UNIFICADO_CACHE:
+        _UNIFICADO_CACHE[clave] = compilar_patron_unificado(patrones)
+    return _UNIFICADO_CACHE[clave]
+
+
+# Tramo inicial de un patrón compuesto solo por caracteres literales
+# (se corta en el primer metacarácter de regex)
+_RE_TRAMO_LITERAL = re.compile(r'^[^\\\[\](){}.*+?|^$]+')
+
+
+def _alternancia_nivel_superior(patron_src: str) -> bool:
+    """True si el patrón tiene una alternancia '|' fuera de todo grupo."""
+    profundidad = 0
+    i = 0
+    while i < len(patron_src):
+        c = patron_src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '[':
+            i += 1
+            while i < len(patron_src) and patron_src[i] != ']':
+                if patron_src[i] == '\\':
+                    i += 1
+                i += 1
+        elif c == '(':
+            profundidad += 1
+        elif c == ')':
+            profundidad -= 1
+        elif c == '|' and profundidad == 0:
+            return True
+        i += 1
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _prefijo_literal(patron_src: str) -> str:
+    """
+    Prefijo literal obligatorio de un patrón (en minúsculas), o None.
+
+    Si el patrón empieza con texto fijo ("Se otorga..."), un str.find de
+    ese texto es mucho más barato que el motor de regex y permite
+    descartar la página sin ejecutar el patrón completo.
+    """
+    if _alternancia_nivel_superior(patron_src):
+        # Con alternativas al nivel superior el prefijo no es obligatorio
+        return None
+
+    m = _RE_TRAMO_LITERAL.match(patron_src)
+    if not m:
+        return None
+
+    prefijo = m.group(0)
+    # Si al tramo literal le sigue un cuantificador opcional, el último
+    # carácter puede no aparecer en la coincidencia
+    if m.end() < len(patron_src) and patron_src[m.end()] in '*?{':
+        prefijo = prefijo[:-1]
+
+    prefijo = prefijo.lower()
+    return prefijo if len(prefijo) >= 4 else None
+
+
+def _limpiar_nombre_extraido(nombre: str) -> str:
+    """Normaliza un nombre capturado; devuelve None si no parece válido."""
+    nombre = nombre.strip()
+    # Limpiar el nombre de saltos de línea y espacios extra
+    nombre = _RE_WS.sub(' ', nombre)
+    # Eliminar texto innecesario que pueda haberse capturado
+    nombre = nombre.split('\n')[0].strip()
+    if nombre and len(nombre) > 2:
+        return nombre
+    return None
+
+
+def _buscar_nombre(texto: str, patrones: list) -> str:
+    """Busca el nombre en un texto ya extraído; None si ningún patrón coincide."""
+    # Camino rápido: un solo recorrido del texto con todos los patrones
+    unificado = _patron_unificado(patrones)
+    if unificado is not None:
+        patron_combinado, indices = unificado
+        match = patron_combinado.search(texto)
+        if match is None:
+            return None
+        for nombre_grupo, indice in indices.items():
+            if match.group(nombre_grupo) is not None:
+                nombre = _limpiar_nombre_extraido(match.group(indice) or "")
+                if nombre:
+                    return nombre
+                break
+        # El nombre capturado no era válido: reintentar patrón por patrón
+
+    texto_minusculas = None
+    for patron in patrones:
+        # Filtro barato: si el patrón exige un prefijo literal que no está
+        # en el texto, ni siquiera se ejecuta el motor de regex
+        prefijo = _prefijo_literal(patron.pattern)
+        if prefijo is not None:
+            if texto_minusculas is None:
+                texto_minusculas = texto.lower()
+            posicion = texto_minusculas.find(prefijo)
+            if posicion < 0:
+                continue
+            match = patron.search(texto, posicion)
+        else:
+            match = patron.search(texto)
+        if match:
+            nombre = _limpiar_nombre_extraido(match.group(1))
+            if nombre:
+                return nombre
+
+    return None
+
+
+def extraer_nombre_de_pagina(pagina, patrones: list = None,
+                             clip_ratio: float = NOMBRE_CLIP_RATIO) -> str:
+    """
+    Extrae el nombre del destinatario del certificado de una página.
+
+    Primero se extrae solo la franja superior de la página (clip_ratio de
+    su altura), donde suele estar el nombre; si ningún patrón coincide se
+    reintenta con la página completa.
+
+    Args:
+        pagina: Objeto de página de PyMuPDF
+        patrones: Lista de patrones regex compilados para buscar el nombre
+        clip_ratio: Fracción superior de la página a extraer primero
+            (un valor fuera de (0, 1) desactiva el recorte)
+
+    Returns:
+        Nombre extraído o None si no se encuentra
+    """
+    if patrones is None:
+        patrones = cargar_patrones()
+
+    # Extraer solo texto plano con banderas mínimas: el modo por defecto
+    # preserva ligaduras y prepara datos que aquí no se usan
+    if 0 < clip_ratio < 1:
+        rect = pagina.rect
+        clip = fitz.Rect(rect.x0, rect.y0, rect.x1,
+                         rect.y0 + rect.height * clip_ratio)
+        texto = pagina.get_text("text", clip=clip, flags=_FLAGS_TEXTO, sort=False)
+        nombre = _buscar_nombre(texto, patrones)
+        if nombre:
+            return nombre
+
+    texto = pagina.get_text("text", flags=_FLAGS_TEXTO, sort=False)
+    return _buscar_nombre(texto, patrones)
+
+
+def _cargar_csv(ruta_archivo: str) -> list:
+    """Lee la primera columna de un CSV con el módulo csv de la stdlib."""
+    import csv
+
+    with open(ruta_archivo, 'r', encoding='utf-8-sig', newline='') as f:
+        return [fila[0].strip() for fila in csv.reader(f) if fila and fila[0].strip()]
+
+
+def _cargar_excel(ruta_archivo: str) -> list:
+    """Lee la primera columna de un .xlsx con openpyxl en modo read_only."""
+    import openpyxl
+
+    libro = openpyxl.load_workbook(ruta_archivo, read_only=True, data_only=True)
+    try:
+        nombres = []
+        for (valor,) in libro.active.iter_rows(values_only=True, max_col=1):
+            if valor is None:
+                continue
+            valor = str(valor).strip()
+            if valor and valor.lower() != 'nan':
+                nombres.append(valor)
+        return nombres
+    finally:
+        libro.close()
+
+
+def _cargar_lista_pandas(ruta_archivo: str, extension: str) -> list:
+    """Carga la lista con pandas (solo como respaldo, p. ej. para .xls)."""
+    import pandas as pd
+
+    if extension == '.csv':
+        df = pd.read_csv(ruta_archivo, header=None)
+    else:
+        df = pd.read_excel(ruta_archivo, header=None)
+
+    # Tomar la primera columna y filtrar vacíos/NaN de forma vectorizada,
+    # sin pasar por una lista intermedia de cadenas Python
+    s = df.iloc[:, 0].astype('string').str.strip()
+    s = s[s.notna() & (s.str.lower() != 'nan') & (s != '')]
+    return s.tolist()
+
+
+def cargar_lista_nombres(ruta_archivo: str) -> list:
+    """
+    Carga una lista de nombres desde un archivo Excel o CSV.
+
+    Los CSV se leen con el módulo csv y los .xlsx con openpyxl en modo
+    read_only, evitando el costo de importar pandas; pandas queda como
+    respaldo para .xls y para cuando openpyxl no está disponible.
+
+    Args:
+        ruta_archivo: Ruta al archivo Excel (.xlsx, .xls) o CSV
+
+    Returns:
+        Lista de nombres
+    """
+    extension = Path(ruta_archivo).suffix.lower()
+
+    try:
+        if extension == '.csv':
+            return _cargar_csv(ruta_archivo)
+        elif extension == '.xlsx':
+            try:
+                return _cargar_excel(ruta_archivo)
+            except ImportError:
+                return _cargar_lista_pandas(ruta_archivo, extension)
+        elif extension == '.xls':
+            return _cargar_lista_pandas(ruta_archivo, extension)
+        else:
+            raise ValueError(f"Formato de archivo no soportado: {extension}")
+
+    except Exception as e:
+        print(f"Error al cargar el archivo de lista: {e}")
+        return []
+
+
+# Patrones recompilados una vez por proceso trabajador (los objetos
+# re.Pattern no se pueden enviar entre procesos, así que se envían las
+# cadenas y cada trabajador las compila una sola vez)
+_PATRONES_POR_PROCESO = {}
+
+
+def _patrones_en_worker(patrones_src: tuple) -> list:
+    """Compila (y cachea por proceso) los patrones recibidos como cadenas."""
+    patrones = _PATRONES_POR_PROCESO.get(patrones_src)
+    if patrones is None:
+        patrones = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in patrones_src]
+        _PATRONES_POR_PROCESO[patrones_src] = patrones
+    return patrones
+
+
+def _procesar_pagina(args) -> tuple:
+    """
+    Trabajador de proceso: extrae el nombre de la página i y la escribe
+    como PDF individual en una ruta temporal.
+
+    El proceso principal se encarga después del renombrado final
+    (incluida la resolución de nombres duplicados).
+
+    Returns:
+        Tupla (i, nombre extraído o None, error o None)
+    """
+    ruta_pdf, i, patrones_src, ruta_temporal, extraer, clip_ratio = args
+    try:
+        documento = _abrir_pdf(ruta_pdf)
+        try:
+            nombre = None
+            if extraer:
+                patrones = _patrones_en_worker(tuple(patrones_src))
+                nombre = extraer_nombre_de_pagina(documento[i], patrones, clip_ratio)
+            nuevo_pdf = fitz.open()
+            nuevo_pdf.insert_pdf(documento, from_page=i, to_page=i, annots=True, links=False)
+            nuevo_pdf.save(ruta_temporal, **_OPCIONES_GUARDADO)
+            nuevo_pdf.close()
+        finally:
+            documento.close()
+        return (i, nombre, None)
+    except Exception as e:
+        return (i, None, str(e))
+
+
+def separar_certificados(
+    ruta_pdf: str,
+    carpeta_salida: str = None,
+    lista_nombres: list = None,
+    patrones: list = None,
+    prefijo: str = "",
+    sufijo: str = "",
+    paralelo: bool = False,
+    tamano_buffer: int = TAMANO_BUFFER_ESCRITURA,
+    clip_ratio: float = NOMBRE_CLIP_RATIO
+) -> dict:
+    """
+    Separa un PDF de múltiples certificados en archivos individuales.
+
+    Con paralelo=True las páginas se procesan en un pool de procesos
+    (un trabajador por núcleo), útil para PDFs con muchas páginas.
+    tamano_buffer controla el buffer de escritura a disco (en bytes) y
+    clip_ratio la franja superior de la página donde buscar el nombre.
+    """
+    # Validar que el archivo existe
+    if not os.path.exists(ruta_pdf):
+        raise FileNotFoundError(f"No se encontró el archivo: {ruta_pdf}")
+    
+    # Usar carpeta de salida por defecto
+    if carpeta_salida is None:
+        carpeta_salida = _SALIDA
+    
+    carpeta_salida = Path(carpeta_salida)
+    carpeta_salida.mkdir(parents=True, exist_ok=True)
+    
+    # Cargar patrones si no se proporcionan
+    if patrones is None:
+        patrones = cargar_patrones()
+    
+    # Abrir el PDF
+    documento = _abrir_pdf(ruta_pdf)
+    total_paginas = len(documento)
+    
+    nombre_pdf = Path(ruta_pdf).name
+    
+    print(f"\n{'='*60}")
+    print(f"📄 Archivo: {nombre_pdf}")
+    print(f"📑 Total de páginas/certificados: {total_paginas}")
+    print(f"📁 Carpeta de salida: {carpeta_salida}")
+    print(f"🔍 Patrones cargados: {len(patrones)}")
+    print(f"{'='*60}\n")
+    
+    # Validar lista de nombres si se proporciona
+    if lista_nombres:
+        if len(lista_nombres) < total_paginas:
+            print(f"⚠️  Advertencia: La lista tiene {len(lista_nombres)} nombres pero hay {total_paginas} páginas.")
+            print("    Se usará extracción automática para las páginas restantes.\n")
+    
+    resultados = {
+        "exitosos": [],
+        "errores": [],
+        "total": total_paginas,
+        "pdf_origen": nombre_pdf
+    }
+    
+    # Nombres ya presentes en la carpeta de salida: un solo recorrido del
+    # directorio en lugar de un stat por candidato en el bucle de duplicados.
+    # También registra los nombres asignados durante esta corrida. Se guardan
+    # con casefold() porque en Windows/macOS el sistema de archivos no
+    # distingue mayúsculas de minúsculas.
+    try:
+        with os.scandir(carpeta_salida) as it:
+            nombres_ocupados = {e.name.casefold() for e in it
+                                if e.name.lower().endswith('.pdf')}
+    except OSError:
+        nombres_ocupados = set()
+
+    # Mensajes de progreso acumulados y vaciados por lotes
+    mensajes = []
+
+    def _registrar(*lineas):
+        mensajes.extend(lineas)
+        if len(mensajes) >= _LOTE_MENSAJES:
+            print("\n".join(mensajes))
+            mensajes.clear()
+
+    def _vaciar_mensajes():
+        if mensajes:
+            print("\n".join(mensajes))
+            mensajes.clear()
+
+    # Procesar cada página
+    if paralelo and total_paginas > 1:
+        # Un trabajo por página; cada trabajador escribe a una ruta temporal
+        # y el proceso principal hace el renombrado final en orden
+        patrones_src = [p.pattern for p in patrones]
+        trabajos = []
+        for i in range(total_paginas):
+            extraer = not (lista_nombres and i < len(lista_nombres))
+            ruta_temporal = carpeta_salida / f".pagina_{i:05d}.tmp"
+            trabajos.append((ruta_pdf, i, patrones_src, str(ruta_temporal), extraer, clip_ratio))
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for i, nombre_extraido, error in executor.map(_procesar_pagina, trabajos):
+                    numero = i + 1
+
+                    if error:
+                        _registrar(f"❌ [{numero}/{total_paginas}] Error al procesar página: {error}")
+                        resultados["errores"].append({
+                            "pagina": numero,
+                            "error": error
+                        })
+                        continue
+
+                    # Determinar el nombre del archivo
+                    if lista_nombres and i < len(lista_nombres):
+                        nombre = lista_nombres[i]
+                        origen = "lista"
+                    elif nombre_extraido:
+                        nombre = nombre_extraido
+                        origen = "extraído"
+                    else:
+                        nombre = f"certificado_{numero:03d}"
+                        origen = "generado"
+
+                    # Limpiar nombre para uso como archivo
+                    nombre_limpio = limpiar_nombre_archivo(nombre)
+                    nombre_archivo = f"{prefijo}{nombre_limpio}{sufijo}.pdf"
+                    ruta_salida = carpeta_salida / nombre_archivo
+
+                    # Manejar nombres duplicados
+                    contador = 1
+                    while nombre_archivo.casefold() in nombres_ocupados:
+                        nombre_archivo = f"{prefijo}{nombre_limpio}_{contador}{sufijo}.pdf"
+                        ruta_salida = carpeta_salida / nombre_archivo
+                        contador += 1
+                    nombres_ocupados.add(nombre_archivo.casefold())
+
+                    os.replace(trabajos[i][3], ruta_salida)
+
+                    estado = "✅" if origen != "generado" else "⚠️"
+                    _registrar(f"{estado} [{numero}/{total_paginas}] {nombre_archivo}",
+                               f"   └─ Nombre: {nombre} ({origen})")
+
+                    resultados["exitosos"].append({
+                        "pagina": numero,
+                        "nombre": nombre,
+                        "archivo": str(ruta_salida),
+                        "origen": origen
+                    })
+
+        finally:
+            _vaciar_mensajes()
+    else:
+        # Hilo escritor en segundo plano: mientras se escribe la página i a
+        # disco, el bucle principal ya está extrayendo/serializando la i+1
+        cola_escritura = queue.Queue(maxsize=_PROFUNDIDAD_COLA_ESCRITURA)
+        errores_escritura = {}
+
+        def _escritor():
+            while True:
+                item = cola_escritura.get()
+                if item is None:
+                    return
+                numero, ruta, data = item
+                try:
+                    _escribir_pdf(ruta, data, tamano_buffer)
+                except Exception as e:
+                    errores_escritura[ruta] = (numero, str(e))
+
+        hilo_escritor = threading.Thread(target=_escritor, name="escritor-pdf",
+                                         daemon=True)
+        hilo_escritor.start()
+
+        try:
+            for i in range(total_paginas):
+                numero = i + 1
+
+                # Determinar el nombre del archivo; si viene de la lista no hace
+                # falta materializar la página ni extraer su texto
+                if lista_nombres and i < len(lista_nombres):
+                    nombre = lista_nombres[i]
+                    origen = "lista"
+                else:
+                    nombre = extraer_nombre_de_pagina(documento[i], patrones, clip_ratio)
+                    origen = "extraído"
+
+                # Si no se pudo obtener un nombre, usar número de página
+                if not nombre:
+                    nombre = f"certificado_{numero:03d}"
+                    origen = "generado"
+
+                # Limpiar nombre para uso como archivo
+                nombre_limpio = limpiar_nombre_archivo(nombre)
+                nombre_archivo = f"{prefijo}{nombre_limpio}{sufijo}.pdf"
+                ruta_salida = carpeta_salida / nombre_archivo
+
+                # Manejar nombres duplicados
+                contador = 1
+                while nombre_archivo.casefold() in nombres_ocupados:
+                    nombre_archivo = f"{prefijo}{nombre_limpio}_{contador}{sufijo}.pdf"
+                    ruta_salida = carpeta_salida / nombre_archivo
+                    contador += 1
+                nombres_ocupados.add(nombre_archivo.casefold())
+
+                try:
+                    # Crear nuevo PDF con esta página y encolarlo para escritura.
+                    # El documento debe ser nuevo en cada iteración: insert_pdf
+                    # copia objetos al xref y delete_page no los elimina, así
+                    # que reutilizar uno haría crecer cada salida con las
+                    # páginas anteriores (guardamos con garbage=0)
+                    nuevo_pdf = fitz.open()
+                    nuevo_pdf.insert_pdf(documento, from_page=i, to_page=i, annots=True, links=False)
+                    data = nuevo_pdf.tobytes(**_OPCIONES_GUARDADO)
+                    nuevo_pdf.close()
+                    cola_escritura.put((numero, str(ruta_salida), data))
+
+                    estado = "✅" if origen != "generado" else "⚠️"
+                    _registrar(f"{estado} [{numero}/{total_paginas}] {nombre_archivo}",
+                               f"   └─ Nombre: {nombre} ({origen})")
+
+                    resultados["exitosos"].append({
+                        "pagina": numero,
+                        "nombre": nombre,
+                        "archivo": str(ruta_salida),
+                        "origen": origen
+                    })
+
+                except Exception as e:
+                    _registrar(f"❌ [{numero}/{total_paginas}] Error al procesar página: {e}")
+                    resultados["errores"].append({
+                        "pagina": numero,
+                        "error": str(e)
+                    })
+
+        finally:
+            # Pase lo que pase con el bucle, volcar el progreso acumulado,
+            # despertar al escritor con el centinela y esperar a que vacíe
+            # la cola; sin esto una excepción dejaría mensajes perdidos y
+            # al hilo bloqueado en get()
+            _vaciar_mensajes()
+            cola_escritura.put(None)
+            hilo_escritor.join()
+
+        if errores_escritura:
+            resultados["exitosos"] = [
+                r for r in resultados["exitosos"]
+                if r["archivo"] not in errores_escritura
+            ]
+            for ruta, (numero, error) in errores_escritura.items():
+                print(f"❌ [{numero}/{total_paginas}] Error al escribir {Path(ruta).name}: {error}")
+                resultados["errores"].append({
+                    "pagina": numero,
+                    "error": error
+                })
+
+    documento.close()
+    
+    # Contar por origen en una sola pasada
+    conteos = collections.Counter(r["origen"] for r in resultados["exitosos"])
+    extraidos = conteos["extraído"]
+    de_lista = conteos["lista"]
+    generados = conteos["generado"]
+    
+    # Resumen final
+    print(f"\n{'='*60}")
+    print(f"📊 RESUMEN - {nombre_pdf}")
+    print(f"{'='*60}")
+    print(f"✅ Exitosos: {len(resultados['exitosos'])}/{total_paginas}")
+    if extraidos > 0:
+        print(f"   └─ Nombres extraídos del PDF: {extraidos}")
+    if de_lista > 0:
+        print(f"   └─ Nombres de lista: {de_lista}")
+    if generados > 0:
+        print(f"   └─ Nombres generados (no encontrados): {generados}")
+    print(f"❌ Errores: {len(resultados['errores'])}/{total_paginas}")
+    print(f"📁 Archivos guardados en: {carpeta_salida}")
+    print(f"{'='*60}\n")
+    
+    return resultados
+
+
+def procesar_carpeta_entrada(
+    lista_nombres: list = None,
+    prefijo: str = "",
+    sufijo: str = "",
+    limpiar_salida: bool = True,
+    eliminar_entrada: bool = True,
+    paralelo: bool = False,
+    tamano_buffer: int = TAMANO_BUFFER_ESCRITURA,
+    clip_ratio: float = NOMBRE_CLIP_RATIO
+) -> list:
+    """
+    Procesa todos los PDFs en la carpeta de entrada.
+    
+    Args:
+        lista_nombres: Lista opcional de nombres para renombrar
+        prefijo: Prefijo para agregar al nombre de cada archivo
+        sufijo: Sufijo para agregar al nombre de cada archivo
+        limpiar_salida: Si True, elimina los PDFs existentes en salida antes de procesar
+        eliminar_entrada: Si True, elimina los PDFs de entrada después de procesarlos
+    """
+    carpeta_entrada = _ENTRADA
+    carpeta_salida = _SALIDA
+    
+    if not carpeta_entrada.exists():
+        carpeta_entrada.mkdir(parents=True, exist_ok=True)
+        print(f"📁 Se creó la carpeta 'entrada/'. Coloca tus PDFs ahí y ejecuta de nuevo.")
+        return []
+    
+    archivos_pdf = list(carpeta_entrada.glob("*.pdf"))
+    
+    if not archivos_pdf:
+        print(f"⚠️  No se encontraron archivos PDF en: {carpeta_entrada}")
+        print("   Coloca tus PDFs en la carpeta 'entrada/' y ejecuta de nuevo.")
+        return []
+    
+    print(f"\n🔍 Encontrados {len(archivos_pdf)} archivo(s) PDF en 'entrada/'")
+    
+    # Limpiar carpeta de salida antes de procesar
+    if limpiar_salida:
+        limpiar_carpeta_salida()
+    
+    todos_resultados = []
+    patrones = cargar_patrones()
+    pdfs_procesados = []  # Lista de PDFs procesados exitosamente
+    
+    for pdf in archivos_pdf:
+        try:
+            resultado = separar_certificados(
+                ruta_pdf=str(pdf),
+                carpeta_salida=str(carpeta_salida),
+                lista_nombres=lista_nombres,
+                patrones=patrones,
+                prefijo=prefijo,
+                sufijo=sufijo,
+                paralelo=paralelo,
+                tamano_buffer=tamano_buffer,
+                clip_ratio=clip_ratio
+            )
+            todos_resultados.append(resultado)
+            
+            # Si no hubo errores, marcar para eliminar
+            if not resultado["errores"]:
+                pdfs_procesados.append(str(pdf))
+                
+        except Exception as e:
+            print(f"❌ Error procesando {pdf.name}: {e}")
+    
+    # Eliminar PDFs de entrada después de procesar exitosamente
+    if eliminar_entrada and pdfs_procesados:
+        print(f"\n🗑️  Limpiando carpeta de entrada...")
+        for pdf_path in pdfs_procesados:
+            eliminar_pdf_entrada(pdf_path)
+    
+    return todos_resultados
+
+
+def mostrar_patrones():
+    """Muestra los patrones de búsqueda actuales."""
+    patrones = cargar_patrones()
+    
+    print(f"\n{'='*60}")
+    print("🔍 PATRONES DE BÚSQUEDA CONFIGURADOS")
+    print(f"{'='*60}")
+    print(f"📄 Archivo: {ARCHIVO_PATRONES}\n")
+    
+    for i, patron in enumerate(patrones, 1):
+        print(f"  {i}. {patron.pattern}")
+    
+    print(f"\n{'='*60}")
+    print("💡 Para agregar nuevos patrones, edita el archivo 'patrones.txt'")
+    print(f"{'='*60}\n")
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(
+        description="Separar PDFs de certificados en archivos individuales",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos de uso:
+  python separar_certificados.py                           # Procesa todos los PDFs en 'entrada/'
+  python separar_certificados.py --archivo mi_archivo.pdf  # Procesa un archivo específico
+  python separar_certificados.py --lista nombres.xlsx      # Usa nombres de un Excel
+  python separar_certificados.py --ver-patrones            # Muestra los patrones configurados
+        """
+    )
+    
+    parser.add_argument(
+        "--archivo", "-a",
+        help="Ruta a un archivo PDF específico (si no se especifica, procesa la carpeta 'entrada/')",
+        default=None
+    )
+    
+    parser.add_argument(
+        "--lista", "-l",
+        help="Archivo Excel o CSV con lista de nombres (en orden)",
+        default=None
+    )
+    
+    parser.add_argument(
+        "--salida", "-o",
+        help="Carpeta donde guardar los certificados separados (por defecto: 'salida/')",
+        default=None
+    )
+    
+    parser.add_argument(
+        "--prefijo",
+        help="Prefijo para agregar al nombre de cada archivo",
+        default=""
+    )
+    
+    parser.add_argument(
+        "--sufijo",
+        help="Sufijo para agregar al nombre de cada archivo (antes de .pdf)",
+        default=""
+    )
+    
+    parser.add_argument(
+        "--ver-patrones",
+        action="store_true",
+        help="Muestra los patrones de búsqueda configurados"
+    )
+    
+    parser.add_argument(
+        "--no-limpiar",
+        action="store_true",
+        help="No eliminar archivos de salida antes de procesar"
+    )
+    
+    parser.add_argument(
+        "--paralelo",
+        action="store_true",
+        help="Procesar las páginas en paralelo usando todos los núcleos disponibles"
+    )
+
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=TAMANO_BUFFER_ESCRITURA,
+        help=f"Tamaño del buffer de escritura en bytes (por defecto: {TAMANO_BUFFER_ESCRITURA})"
+    )
+
+    parser.add_argument(
+        "--clip-ratio",
+        type=float,
+        default=NOMBRE_CLIP_RATIO,
+        help="Fracción superior de la página donde buscar el nombre primero "
+             f"(por defecto: {NOMBRE_CLIP_RATIO}; usar 1 para página completa)"
+    )
+
+    parser.add_argument(
+        "--no-borrar-entrada",
+        action="store_true",
+        help="No eliminar PDFs de entrada después de procesarlos"
+    )
+    
+    args = parser.parse_args()
+    
+    # Mostrar patrones si se solicita
+    if args.ver_patrones:
+        mostrar_patrones()
+        return
+    
+    # Cargar lista de nombres si se proporciona
+    lista_nombres = None
+    if args.lista:
+        if not os.path.exists(args.lista):
+            print(f"❌ Error: No se encontró el archivo de lista: {args.lista}")
+            sys.exit(1)
+        lista_nombres = cargar_lista_nombres(args.lista)
+        if lista_nombres:
+            print(f"📋 Lista cargada con {len(lista_nombres)} nombres")
+        else:
+            print("⚠️  No se pudieron cargar nombres de la lista. Se usará extracción automática.")
+    
+    # Procesar archivo específico o carpeta
+    try:
+        if args.archivo:
+            resultado = separar_certificados(
+                ruta_pdf=args.archivo,
+                carpeta_salida=args.salida,
+                lista_nombres=lista_nombres,
+                prefijo=args.prefijo,
+                sufijo=args.sufijo,
+                paralelo=args.paralelo,
+                tamano_buffer=args.buffer_size,
+                clip_ratio=args.clip_ratio
+            )
+            if resultado["errores"]:
+                sys.exit(1)
+        else:
+            resultados = procesar_carpeta_entrada(
+                lista_nombres=lista_nombres,
+                prefijo=args.prefijo,
+                sufijo=args.sufijo,
+                limpiar_salida=not args.no_limpiar,
+                eliminar_entrada=not args.no_borrar_entrada,
+                paralelo=args.paralelo,
+                tamano_buffer=args.buffer_size,
+                clip_ratio=args.clip_ratio
+            )
+            if not resultados:
+                sys.exit(1)
+        
+        sys.exit(0)
+        
+    except Exception as e:
+        print(f"❌ Error fatal: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()